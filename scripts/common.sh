@@ -1,16 +1,16 @@
 #!/usr/bin/env bash
 set -euo pipefail
+shopt -s extglob
+
+WORKSPACE_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+DEVCONTAINER_TEMPLATE="${WORKSPACE_ROOT}/templates/devcontainer.json.tpl"
 
 slugify() {
-  local input="$1"
   local slug
-  slug=$(echo "$input" | tr '[:upper:]' '[:lower:]' | tr -cs 'a-z0-9' '-')
-  while [[ "$slug" == -* ]]; do
-    slug=${slug#-}
-  done
-  while [[ "$slug" == *- ]]; do
-    slug=${slug%-}
-  done
+  slug=$(printf '%s' "$1" | tr '[:upper:]' '[:lower:]')
+  slug=${slug//+([^a-z0-9])/-}
+  slug=${slug#-}
+  slug=${slug%-}
   echo "$slug"
 }
 
@@ -45,7 +45,11 @@ create_session_dir() {
     dir_name="${timestamp}"
   fi
   local session_dir="session/${dir_name}"
-  mkdir -p session
+  local suffix=2
+  while [[ -e "$session_dir" ]]; do
+    session_dir="session/${dir_name}-${suffix}"
+    suffix=$((suffix + 1))
+  done
   echo "$session_dir"
 }
 
@@ -53,7 +57,11 @@ prepare_workspace() {
   local session_dir="$1"
   local repo_url="$2"
   if [[ -n "$repo_url" ]]; then
-    git clone "$repo_url" "$session_dir"
+    if [[ -n "${WORKSPACE_FULL_CLONE:-}" ]]; then
+      git -c protocol.version=2 clone --progress "$repo_url" "$session_dir"
+    else
+      git -c protocol.version=2 clone --depth 1 --single-branch --filter=blob:none --progress "$repo_url" "$session_dir"
+    fi
   else
     mkdir -p "$session_dir"
   fi
@@ -62,7 +70,6 @@ prepare_workspace() {
 apply_devcontainer_template() {
   local session_dir="$1"
   local project_name="$2"
-  local template_path="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)/templates/devcontainer.json.tpl"
   local devcontainer_dir="${session_dir}/.devcontainer"
   local target_file="${devcontainer_dir}/devcontainer.json"
   if [[ -f "$target_file" ]]; then
@@ -75,7 +82,7 @@ apply_devcontainer_template() {
   fi
   local escaped
   escaped=$(printf '%s' "$name" | sed 's/[\/&]/\\&/g')
-  sed "s/__PROJECT_NAME__/${escaped}/g" "$template_path" > "$target_file"
+  sed "s/__PROJECT_NAME__/${escaped}/g" "$DEVCONTAINER_TEMPLATE" > "$target_file"
 }
 
 open_with_editor() {
@@ -95,3 +102,33 @@ open_with_editor() {
   echo "Warning: Could not find an installed editor command to open ${session_dir}." >&2
   return 1
 }
+
+run_new_project() {
+  local editor_cmd="$1"
+  local fallback_cmd="$2"
+  local mac_app="$3"
+  local repo_url="$4"
+  local project_name="$5"
+
+  repo_url=$(resolve_repo_url "$repo_url")
+  project_name=$(resolve_project_name "$project_name")
+
+  local session_dir
+  session_dir=$(create_session_dir "$project_name")
+  prepare_workspace "$session_dir" "$repo_url"
+  apply_devcontainer_template "$session_dir" "$project_name"
+
+  if [[ -z "$repo_url" ]]; then
+    echo "Initialized empty project at ${session_dir}."
+  else
+    echo "Cloned ${repo_url} into ${session_dir}."
+  fi
+
+  if ! open_with_editor "$editor_cmd" "$fallback_cmd" "$session_dir"; then
+    if [[ "$(uname)" == "Darwin" ]] && command -v open >/dev/null 2>&1; then
+      open -a "$mac_app" "$session_dir" || true
+    else
+      echo "Warning: ${mac_app} CLI not found. Open ${session_dir} manually." >&2
+    fi
+  fi
+}